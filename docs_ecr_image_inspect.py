@@ -1,18 +1,22 @@
 import os
-import boto3
+import logging
 import glob
-import docker
 import base64
-from datetime import datetime
-from jinja2 import Template
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from dotenv import load_dotenv
-import nbformat as nbf
+from ecr_readme import write_notebook
 
 load_dotenv(override=False)
 
 def get_env(key, default=None):
     return os.getenv(key, default)
 
+logging.basicConfig(level=get_env("LOG_LEVEL", "INFO").upper(), format="[%(levelname)s] %(message)s")
+log = logging.getLogger(__name__)
+
 AWS_ECR_PUBLIC_ALIAS = get_env("AWS_ECR_PUBLIC_ALIAS", "dev1-sg")
 AWS_ECR_PUBLIC_REGION = get_env("AWS_ECR_PUBLIC_REGION", "us-east-1")
 AWS_ECR_PUBLIC_REPOSITORY_GROUP = get_env("AWS_ECR_PUBLIC_REPOSITORY_GROUP", "base")
@@ -20,8 +24,23 @@ AWS_ECR_PUBLIC_REPOSITORY_GROUP = get_env("AWS_ECR_PUBLIC_REPOSITORY_GROUP", "ba
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 README_TEMPLATE_PATH = get_env("README_TEMPLATE_PATH", os.path.join(BASE_DIR, "../templates/ecr-image-inspect.j2"))
 SRC_PATH = get_env("SRC_PATH", os.path.join(BASE_DIR,"../src"))
+IMAGE_MAX_WORKERS = int(get_env("IMAGE_MAX_WORKERS", "8"))
+
+@functools.lru_cache(maxsize=None)
+def get_template_env():
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader(os.path.dirname(README_TEMPLATE_PATH)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
 
 def login_to_ecr_public(region_name="us-east-1"):
+    import boto3
+    import docker
+
     ecr = boto3.client("ecr-public", region_name=region_name)
     token = ecr.get_authorization_token()["authorizationData"]["authorizationToken"]
     decoded = base64.b64decode(token).decode()
@@ -33,108 +52,178 @@ def login_to_ecr_public(region_name="us-east-1"):
         password=password,
         registry="public.ecr.aws"
     )
-    print("[INFO] Logged in to ECR Public:", login_response)
+    log.info("Logged in to ECR Public: %s", login_response)
+
+def get_current_local_image(client, image_name):
+    import docker
+
+    try:
+        local = client.images.get(image_name)
+        remote = client.images.get_registry_data(image_name)
+    except docker.errors.ImageNotFound:
+        return None
+    except docker.errors.APIError as e:
+        log.warning("Could not compare digests for %s: %s", image_name, e)
+        return None
+    if any(digest.endswith(f"@{remote.id}") for digest in local.attrs.get("RepoDigests", [])):
+        return local
+    return None
 
 def pull_image(client, image_name):
-    print(f"[DEBUG] Pulling image: {image_name}")
-    low_level = docker.APIClient()
+    import docker
+
+    log.debug("Pulling image: %s", image_name)
+    local = get_current_local_image(client, image_name)
+    if local is not None:
+        log.debug("Local image matches registry digest, skipping pull")
+        return local
     try:
-        for line in low_level.pull(image_name, stream=True, decode=True):
-            if 'status' in line:
-                print(f"  [pull] {line['status']}", end='')
-                if 'progress' in line:
-                    print(f" {line['progress']}")
-                else:
-                    print()
-            elif 'error' in line:
-                print(f"[ERROR] Pull error: {line['error']}")
+        for line in client.api.pull(image_name, stream=True, decode=True):
+            if 'error' in line:
+                log.error("Pull error: %s", line['error'])
+            elif line.get('status') == "Pull complete":
+                log.debug("[pull] %s: %s", line.get('id'), line['status'])
         image = client.images.get(image_name)
-        print("[DEBUG] Pull complete")
+        log.debug("Pull complete")
         return image
     except docker.errors.APIError as e:
-        print(f"[ERROR] Failed to pull image {image_name}: {e}")
+        log.error("Failed to pull image %s: %s", image_name, e)
         raise
 
-def get_arch(client, image):
-    arch = client.images.get(image.id).attrs.get("Architecture", "unknown")
-    print(f"[DEBUG] Image architecture: {arch}")
+def get_arch(image):
+    arch = image.attrs.get("Architecture", "unknown")
+    log.debug("Image architecture: %s", arch)
     return arch
 
-def run_cmd(client, image, cmd, arch):
-    print(f"[DEBUG] Running command '{cmd}' on image '{image}' with arch '{arch}'")
+def get_env_vars(image):
+    return (image.attrs.get("Config") or {}).get("Env") or []
+
+def start_container(client, image, arch):
+    import docker
+
+    log.debug("Starting container for image '%s' with arch '%s'", image, arch)
     try:
-        output = client.containers.run(image, cmd, remove=True, platform=f"linux/{arch}")
-        decoded = output.decode()
-        print(f"[DEBUG] Command output:\n{decoded}")
-        return decoded
-    except docker.errors.ContainerError as e:
-        print(f"[ERROR] Container command error:\n{e.stderr.decode() if e.stderr else str(e)}")
+        return client.containers.run(
+            image,
+            entrypoint=["tail", "-f", "/dev/null"],
+            detach=True,
+            platform=f"linux/{arch}",
+        )
+    except docker.errors.APIError as e:
+        log.error("Docker API error starting container: %s", e)
         raise
+
+def stop_container(container):
+    import docker
+
+    log.debug("Removing container %s", container.short_id)
+    try:
+        container.remove(force=True)
     except docker.errors.APIError as e:
-        print(f"[ERROR] Docker API error during command: {e}")
+        log.warning("Failed to remove container %s: %s", container.short_id, e)
+
+def run_cmd(container, cmd):
+    import docker
+
+    log.debug("Running command '%s' in container '%s'", cmd, container.short_id)
+    try:
+        exit_code, (stdout, stderr) = container.exec_run(cmd, demux=True)
+    except docker.errors.APIError as e:
+        log.error("Docker API error during command: %s", e)
         raise
+    decoded = stdout.decode() if stdout else ""
+    if exit_code != 0:
+        err = stderr.decode() if stderr else decoded
+        log.error("Container command error:\n%s", err)
+        raise docker.errors.ContainerError(container, exit_code, cmd, container.attrs["Config"]["Image"], err)
+    log.debug("Command output:\n%s", decoded)
+    return decoded
 
 def parse_kv(output):
     return dict(line.split("=", 1) for line in output.strip().splitlines() if "=" in line)
 
-def get_pkgs(client, image, arch):
+def get_pkgs(container):
+    import docker
+
     try:
-        return run_cmd(client, image, "apk info", arch).splitlines()
+        return run_cmd(container, "apk info").splitlines()
     except docker.errors.DockerException:
         try:
-            return run_cmd(client, image, "sh -c 'apt list | tail -n +2'", arch).splitlines()
+            return run_cmd(container, "sh -c 'apt list | tail -n +2'").splitlines()
         except docker.errors.DockerException as e:
-            print(f"[WARN] Both apk and apt commands failed: {e}")
+            log.warning("Both apk and apt commands failed: %s", e)
             return []
 
+_thread_local = threading.local()
+
+def get_thread_docker_client():
+    import docker
+
+    client = getattr(_thread_local, "client", None)
+    if client is None:
+        client = _thread_local.client = docker.from_env()
+    return client
+
+def process_image(dir_path, template, updated_time):
+    client = get_thread_docker_client()
+    image_name = os.path.basename(os.path.normpath(dir_path))
+    image_uri = f"public.ecr.aws/{AWS_ECR_PUBLIC_ALIAS}/{AWS_ECR_PUBLIC_REPOSITORY_GROUP}/{image_name}"
+    notebook_path = os.path.join(dir_path, "inspect-image.ipynb")
+
+    log.info("Processing image %s", image_name)
+
+    try:
+        image = pull_image(client, image_uri)
+        arch = get_arch(image)
+        env_vars = get_env_vars(image)
+        container = start_container(client, image_uri, arch)
+        try:
+            os_release = parse_kv(run_cmd(container, "cat /etc/os-release"))
+            pkgs = get_pkgs(container)
+            local_bins = run_cmd(container, "ls -1 /usr/local/bin").splitlines()
+        finally:
+            stop_container(container)
+
+        markdown = template.render(
+            context={
+                "image": image_uri,
+                "arch": arch,
+                "os_name": os_release.get("NAME"),
+                "os_version_id": os_release.get("VERSION_ID"),
+                "os_id": os_release.get("ID"),
+                "env_vars": env_vars,
+                "pkg_vars": pkgs,
+                "pkg_local": local_bins,
+            },
+            updated_at=updated_time,
+        )
+
+        write_notebook(notebook_path, markdown)
+
+        log.info("Wrote notebook for %s", image_name)
+
+    except Exception as e:
+        log.error("Failed processing %s: %s", image_name, e)
+
 def main():
-    client = docker.from_env()
-    updated_time = datetime.now().astimezone().strftime("%c")
+    updated_time = datetime.now(timezone.utc).astimezone().isoformat(timespec='seconds')
 
     login_to_ecr_public()
 
-    for dir_path in glob.glob(f"{SRC_PATH}/*/"):
-        image_name = os.path.basename(os.path.normpath(dir_path))
-        image_uri = f"public.ecr.aws/{AWS_ECR_PUBLIC_ALIAS}/{AWS_ECR_PUBLIC_REPOSITORY_GROUP}/{image_name}"
-        notebook_path = os.path.join(dir_path, "inspect-image.ipynb")
-
-        print(f"[INFO] Processing image {image_name}")
+    template = get_template_env().get_template(os.path.basename(README_TEMPLATE_PATH))
 
+    with ThreadPoolExecutor(max_workers=IMAGE_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(process_image, dir_path, template, updated_time)
+            for dir_path in glob.glob(f"{SRC_PATH}/*/")
+        ]
         try:
-            image = pull_image(client, image_uri)
-            arch = get_arch(client, image)
-            os_release = parse_kv(run_cmd(client, image_uri, "cat /etc/os-release", arch))
-            env_vars = run_cmd(client, image_uri, "env", arch).splitlines()
-            pkgs = get_pkgs(client, image_uri, arch)
-            local_bins = run_cmd(client, image_uri, "ls -1 /usr/local/bin", arch).splitlines()
-
-            with open(README_TEMPLATE_PATH) as f:
-                template = Template(f.read(), trim_blocks=True, lstrip_blocks=True)
-
-            markdown = template.render(
-                context={
-                    "image": image_uri,
-                    "arch": arch,
-                    "os_name": os_release.get("NAME"),
-                    "os_version_id": os_release.get("VERSION_ID"),
-                    "os_id": os_release.get("ID"),
-                    "env_vars": env_vars,
-                    "pkg_vars": pkgs,
-                    "pkg_local": local_bins,
-                },
-                updated_at=updated_time,
-            )
-
-            nb = nbf.v4.new_notebook()
-            nb.cells.append(nbf.v4.new_markdown_cell(markdown))
-
-            with open(notebook_path, "w", encoding="utf-8") as f:
-                nbf.write(nb, f)
-
-            print(f"[INFO] Wrote notebook for {image_name}")
-
-        except Exception as e:
-            print(f"[ERROR] Failed processing {image_name}: {e}")
+            for future in as_completed(futures):
+                future.result()
+        except KeyboardInterrupt:
+            log.warning("Interrupted, cancelling images that have not started")
+            executor.shutdown(cancel_futures=True)
+            raise
 
 if __name__ == "__main__":
     main()
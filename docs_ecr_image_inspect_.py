@@ -1,18 +1,19 @@
 import sys
 import os
-import boto3
-import docker
+import logging
 import base64
-from datetime import datetime
-from jinja2 import Template
+from datetime import datetime, timezone
 from dotenv import load_dotenv
-import nbformat as nbf
+from ecr_readme import write_notebook
 
 load_dotenv(override=False)
 
 def get_env(key, default=None):
     return os.getenv(key, default)
 
+logging.basicConfig(level=get_env("LOG_LEVEL", "INFO").upper(), format="[%(levelname)s] %(message)s")
+log = logging.getLogger(__name__)
+
 AWS_ECR_PUBLIC_ALIAS = get_env("AWS_ECR_PUBLIC_ALIAS", "dev1-sg")
 AWS_ECR_PUBLIC_REGION = get_env("AWS_ECR_PUBLIC_REGION", "us-east-1")
 AWS_ECR_PUBLIC_REPOSITORY_GROUP = get_env("AWS_ECR_PUBLIC_REPOSITORY_GROUP", "base")
@@ -21,10 +22,10 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 README_TEMPLATE_PATH = get_env("README_TEMPLATE_PATH", os.path.join(BASE_DIR, "../templates/ecr-image-inspect.j2"))
 SRC_PATH = get_env("SRC_PATH", os.path.join(BASE_DIR,"../src"))
 
-now = datetime.now().astimezone()
-updated_time = now.strftime("%c"), now.tzname()
-
 def login_to_ecr_public(region_name="us-east-1"):
+    import boto3
+    import docker
+
     ecr = boto3.client("ecr-public", region_name=region_name)
     token = ecr.get_authorization_token()["authorizationData"]["authorizationToken"]
     decoded = base64.b64decode(token).decode()
@@ -36,35 +37,56 @@ def login_to_ecr_public(region_name="us-east-1"):
         password=password,
         registry="public.ecr.aws"
     )
-    print("[INFO] Logged in to ECR Public:", login_response)
+    log.info("Logged in to ECR Public: %s", login_response)
+
+def get_current_local_image(client, image_name):
+    import docker
+
+    try:
+        local = client.images.get(image_name)
+        remote = client.images.get_registry_data(image_name)
+    except docker.errors.ImageNotFound:
+        return None
+    except docker.errors.APIError as e:
+        log.warning("Could not compare digests for %s: %s", image_name, e)
+        return None
+    if any(digest.endswith(f"@{remote.id}") for digest in local.attrs.get("RepoDigests", [])):
+        return local
+    return None
 
 def pull_image(client, image_name):
-    print(f"[DEBUG] Pulling image: {image_name}")
-    low_level = docker.APIClient()
+    import docker
+
+    log.debug("Pulling image: %s", image_name)
+    local = get_current_local_image(client, image_name)
+    if local is not None:
+        log.debug("Local image matches registry digest, skipping pull")
+        return local
     try:
-        for line in low_level.pull(image_name, stream=True, decode=True):
-            if 'status' in line:
-                print(f"  [pull] {line['status']}", end='')
-                if 'progress' in line:
-                    print(f" {line['progress']}")
-                else:
-                    print()
-            elif 'error' in line:
-                print(f"[ERROR] Pull error: {line['error']}")
+        for line in client.api.pull(image_name, stream=True, decode=True):
+            if 'error' in line:
+                log.error("Pull error: %s", line['error'])
+            elif line.get('status') == "Pull complete":
+                log.debug("[pull] %s: %s", line.get('id'), line['status'])
         image = client.images.get(image_name)
-        print("[DEBUG] Image pull complete")
+        log.debug("Image pull complete")
         return image
     except docker.errors.APIError as e:
-        print(f"[ERROR] Failed to pull image {image_name}: {e}")
+        log.error("Failed to pull image %s: %s", image_name, e)
         raise
 
-def get_image_architecture(client, image):
-    arch = client.images.get(image.id).attrs.get("Architecture", "unknown")
-    print(f"[DEBUG] Image architecture: {arch}")
+def get_image_architecture(image):
+    arch = image.attrs.get("Architecture", "unknown")
+    log.debug("Image architecture: %s", arch)
     return arch
 
+def get_image_env_vars(image):
+    return (image.attrs.get("Config") or {}).get("Env") or []
+
 def run_container_command(client, image_name, command, arch):
-    print(f"[DEBUG] Running command on image '{image_name}' with arch '{arch}': {command}")
+    import docker
+
+    log.debug("Running command on image '%s' with arch '%s': %s", image_name, arch, command)
     try:
         output = client.containers.run(
             image=image_name,
@@ -73,14 +95,14 @@ def run_container_command(client, image_name, command, arch):
             platform=f"linux/{arch}"
         )
         decoded = output.decode("utf-8")
-        print(f"[DEBUG] Command output:\n{decoded}")
+        log.debug("Command output:\n%s", decoded)
         return decoded
     except docker.errors.ContainerError as e:
         stderr = e.stderr.decode() if e.stderr else str(e)
-        print(f"[ERROR] Container command failed:\n{stderr}")
+        log.error("Container command failed:\n%s", stderr)
         raise
     except docker.errors.APIError as e:
-        print(f"[ERROR] Docker API error: {e}")
+        log.error("Docker API error: %s", e)
         raise
 
 def parse_key_value_output(output):
@@ -92,13 +114,15 @@ def parse_key_value_output(output):
     return result
 
 def run_command_with_fallback(client, image_name, arch):
+    import docker
+
     try:
         return run_container_command(client, image_name, "apk info", arch).strip().splitlines()
     except (docker.errors.ContainerError, docker.errors.APIError):
         try:
             return run_container_command(client, image_name, "sh -c 'apt list | tail -n +2'", arch).strip().splitlines()
         except (docker.errors.ContainerError, docker.errors.APIError) as e:
-            print(f"[WARN] Both apk and apt commands failed for {image_name}: {e}")
+            log.warning("Both apk and apt commands failed for %s: %s", image_name, e)
             return []
 
 def main():
@@ -110,9 +134,14 @@ def main():
     target_dir = os.path.join(SRC_PATH, keyword)
 
     if not os.path.isdir(target_dir):
-        print(f"[ERROR] Directory not found: {target_dir}")
+        log.error("Directory not found: %s", target_dir)
         sys.exit(1)
 
+    import docker
+    from jinja2 import Template
+
+    updated_time = datetime.now(timezone.utc).astimezone().isoformat(timespec='seconds')
+
     client = docker.from_env()
 
     docker_image_name = keyword
@@ -123,13 +152,12 @@ def main():
 
     try:
         image = pull_image(client, ecr_public_image_uri)
-        arch = get_image_architecture(client, image)
+        arch = get_image_architecture(image)
 
         os_release_str = run_container_command(client, ecr_public_image_uri, "cat /etc/os-release", arch)
         os_release_info = parse_key_value_output(os_release_str)
 
-        env_output_str = run_container_command(client, ecr_public_image_uri, "env", arch)
-        env_vars = env_output_str.strip().splitlines()
+        env_vars = get_image_env_vars(image)
 
         pkg_vars = run_command_with_fallback(client, ecr_public_image_uri, arch)
 
@@ -153,15 +181,11 @@ def main():
 
         markdown = template.render(context=context, updated_at=updated_time)
 
-        nb = nbf.v4.new_notebook()
-        nb.cells.append(nbf.v4.new_markdown_cell(markdown))
-
-        print(f"[INFO] Writing notebook to: {notebook_output_path}")
-        with open(notebook_output_path, "w", encoding="utf-8") as f:
-            nbf.write(nb, f)
+        log.info("Writing notebook to: %s", notebook_output_path)
+        write_notebook(notebook_output_path, markdown)
 
     except Exception as e:
-        print(f"[ERROR] Failed to process {docker_image_name}: {e}")
+        log.error("Failed to process %s: %s", docker_image_name, e)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,210 @@
+import os
+import logging
+import json
+import time
+import functools
+import operator
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from dotenv import load_dotenv
+
+load_dotenv(override=False)
+
+def get_env(key, default=None):
+    return os.getenv(key, default)
+
+log = logging.getLogger(__name__)
+
+AWS_ECR_PUBLIC_ALIAS = get_env("AWS_ECR_PUBLIC_ALIAS", "dev1-sg")
+AWS_ECR_PUBLIC_REGION = get_env("AWS_ECR_PUBLIC_REGION", "us-east-1")
+AWS_ECR_PUBLIC_URI = f"public.ecr.aws/{AWS_ECR_PUBLIC_ALIAS}"
+AWS_ECR_PUBLIC_URL = f"https://ecr-public.{AWS_ECR_PUBLIC_REGION}.amazonaws.com"
+AWS_ECR_PUBLIC_REPOSITORY_GROUP = get_env("AWS_ECR_PUBLIC_REPOSITORY_GROUP", "base")
+AWS_ECR_PUBLIC_MAX_WORKERS = int(get_env("AWS_ECR_PUBLIC_MAX_WORKERS", "16"))
+DESCRIBE_IMAGES_PAGE_SIZE = 100
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = get_env("CACHE_PATH", os.path.join(BASE_DIR, ".ecr_cache.json"))
+CACHE_TTL_SECONDS = int(get_env("CACHE_TTL_SECONDS", "3600"))
+
+ROW_TMPL = "| {number} | [{name}](https://gallery.ecr.aws/{alias}/{name}) | {group} | {uri} | {latest_tag} | {image_size_mb} |"
+
+@functools.lru_cache(maxsize=None)
+def get_ecr_client():
+    import boto3
+    from botocore.config import Config
+
+    log.debug("Creating ECR public client for region %s", AWS_ECR_PUBLIC_REGION)
+    return boto3.Session().client(
+        "ecr-public",
+        region_name=AWS_ECR_PUBLIC_REGION,
+        endpoint_url=AWS_ECR_PUBLIC_URL,
+        config=Config(
+            signature_version='v4',
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            tcp_keepalive=True,
+            max_pool_connections=max(AWS_ECR_PUBLIC_MAX_WORKERS, 10),
+        )
+    )
+
+def get_repositories(client, prefix=None):
+    repos = []
+    log.debug("Retrieving repositories from ECR public")
+    try:
+        for page in client.get_paginator("describe_repositories").paginate():
+            for repo in page.get("repositories", []):
+                if prefix is None or repo["repositoryName"].startswith(prefix):
+                    repos.append(repo)
+                    log.debug("Found repository: %s", repo['repositoryName'])
+    except Exception as e:
+        log.error("Failed to list repositories: %s", e)
+        raise
+    log.debug("Total repositories found: %s", len(repos))
+    return repos
+
+def image_recency_key(img):
+    has_real_tag = any(t != "latest" for t in img.get("imageTags", ()))
+    return has_real_tag, img.get("imagePushedAt", datetime.min)
+
+def get_latest_image_info(client, repository_name):
+    log.debug("Getting latest image info for repository: %s", repository_name)
+    try:
+        pages = client.get_paginator("describe_images").paginate(
+            repositoryName=repository_name,
+            PaginationConfig={"PageSize": DESCRIBE_IMAGES_PAGE_SIZE, "MaxItems": DESCRIBE_IMAGES_PAGE_SIZE},
+        )
+        images = next(iter(pages), {}).get("imageDetails", [])
+        if not images:
+            log.warning("No images found in repository %s", repository_name)
+            return "<none>", 0
+
+        latest_image = max(images, key=image_recency_key)
+
+        tags = latest_image.get("imageTags", [])
+        tag = next((t for t in tags if t != "latest"), tags[0] if tags else "<none>")
+        size_mb = latest_image.get("imageSizeInBytes", 0) / (1024 ** 2)
+
+        log.debug("Latest tag: %s, Size: %.2f MB", tag, size_mb)
+        return tag, size_mb
+
+    except client.exceptions.RepositoryNotFoundException:
+        log.warning("Repository not found: %s", repository_name)
+    except Exception as e:
+        log.error("Failed to get image info for %s: %s", repository_name, e)
+    return "<none>", 0
+
+def load_cache(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        log.debug("No usable cache at %s: %s", path, e)
+        return {}
+    if not isinstance(cache, dict) or not all(isinstance(entry, dict) for entry in cache.values()):
+        log.warning("Ignoring malformed cache at %s", path)
+        return {}
+    return cache
+
+def save_cache(path, cache):
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        log.warning("Could not write cache to %s: %s", path, e)
+        return
+    log.debug("Cache saved to %s", path)
+
+def repository_signature(repo):
+    return f"{repo['repositoryArn']}@{repo['createdAt'].isoformat()}"
+
+def get_cached_image_info(cache, repo):
+    entry = cache.get(repo["repositoryName"])
+    if not entry or entry.get("sig") != repository_signature(repo):
+        return None
+    if time.time() - entry.get("cached_at", 0) > CACHE_TTL_SECONDS:
+        return None
+    if "tag" not in entry or "size_mb" not in entry:
+        return None
+    return entry["tag"], entry["size_mb"]
+
+def fetch_all(prefix=None, use_cache=True):
+    client = get_ecr_client()
+    repos = get_repositories(client, prefix=prefix)
+    repos.sort(key=operator.itemgetter("repositoryName"))
+
+    cache = load_cache(CACHE_PATH) if use_cache else {}
+    image_infos = {}
+    stale_repos = []
+    for repo in repos:
+        cached = get_cached_image_info(cache, repo)
+        if cached is None:
+            stale_repos.append(repo)
+        else:
+            image_infos[repo["repositoryName"]] = cached
+    log.info("Using cached image info for %s of %s repositories", len(image_infos), len(repos))
+
+    with ThreadPoolExecutor(max_workers=AWS_ECR_PUBLIC_MAX_WORKERS) as executor:
+        fresh = executor.map(lambda r: get_latest_image_info(client, r["repositoryName"]), stale_repos)
+        for repo, (tag, size_mb) in zip(stale_repos, fresh):
+            name = repo["repositoryName"]
+            image_infos[name] = tag, size_mb
+            if tag != "<none>":
+                cache[name] = {"sig": repository_signature(repo), "tag": tag, "size_mb": size_mb, "cached_at": time.time()}
+
+    save_cache(CACHE_PATH, {r["repositoryName"]: cache[r["repositoryName"]] for r in repos if r["repositoryName"] in cache})
+
+    items = []
+    for i, repo in enumerate(repos, 1):
+        name = repo["repositoryName"]
+        latest_tag, image_size_mb = image_infos[name]
+        items.append({
+            "number": i,
+            "name": name,
+            "group": name.split("/")[0] if "/" in name else "-",
+            "uri": f"{AWS_ECR_PUBLIC_URI}/{name}",
+            "latest_tag": latest_tag,
+            "image_size_mb": f"{image_size_mb:.2f}"
+        })
+    return items
+
+def render_markdown(items, updated_at):
+    header = (
+        "## Docker Images\n\n"
+        "This repository contains Dockerfiles for building Docker images.\n\n"
+        f"[https://gallery.ecr.aws/{AWS_ECR_PUBLIC_ALIAS}/](https://gallery.ecr.aws/{AWS_ECR_PUBLIC_ALIAS}/)\n\n"
+        "| # | Repository Name | Group | URI | Latest Tag | Image Size (MB) |\n"
+        "|---|---|---|---|---|---|\n"
+    )
+
+    rows = [ROW_TMPL.format_map({**item, "alias": AWS_ECR_PUBLIC_ALIAS}) for item in items]
+
+    return header + "\n".join(rows) + f"\n\n---\n\nlast_updated: {updated_at}\n"
+
+@functools.lru_cache(maxsize=None)
+def get_template(path):
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(loader=FileSystemLoader(os.path.dirname(path)))
+    return env.get_template(os.path.basename(path))
+
+def render_template(items, updated_at, path):
+    return get_template(path).render(items=items, updated_at=updated_at, alias=AWS_ECR_PUBLIC_ALIAS)
+
+def new_markdown_notebook(markdown):
+    return {
+        "cells": [{
+            "cell_type": "markdown",
+            "id": uuid.uuid4().hex[:8],
+            "metadata": {},
+            "source": markdown.splitlines(keepends=True),
+        }],
+        "metadata": {},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+
+def write_notebook(path, markdown):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(new_markdown_notebook(markdown), f, indent=1, sort_keys=True, ensure_ascii=False)
+        f.write("\n")